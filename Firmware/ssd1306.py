@@ -22,6 +22,10 @@ SET_DISP_CLK_DIV = const(0xD5)
 SET_PRECHARGE = const(0xD9)
 SET_VCOM_DESEL = const(0xDB)
 SET_CHARGE_PUMP = const(0x8D)
+SET_HWSCROLL_OFF = const(0x2E)
+SET_HWSCROLL_ON = const(0x2F)
+SET_HWSCROLL_RIGHT = const(0x26)
+SET_HWSCROLL_LEFT = const(0x27)
 
 # Subclassing FrameBuffer provides support for graphics primitives
 # http://docs.micropython.org/en/latest/pyboard/library/framebuf.html
@@ -33,45 +37,78 @@ class SSD1306(framebuf.FrameBuffer):
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
+        # preallocated command buffers, reused on every call
+        x0 = 0
+        x1 = self.width - 1
+        if self.width == 64:
+            # displays with width of 64 pixels are shifted by 32
+            x0 += 32
+            x1 += 32
+        self.show_cmds = bytes(
+            (SET_COL_ADDR, x0, x1, SET_PAGE_ADDR, 0, self.pages - 1)
+        )
+        self.contrast_cmds = bytearray((SET_CONTRAST, 0xFF))
+        self.hwscroll_cmds = bytearray(
+            (
+                SET_HWSCROLL_OFF,
+                SET_HWSCROLL_RIGHT,
+                0x00,
+                0,  # start page
+                0,  # frame interval
+                self.pages - 1,  # end page
+                0x00,
+                0xFF,
+                SET_HWSCROLL_ON,
+            )
+        )
+        self.cmd_buf = bytearray(1)
+        self._scrolling = False
         self.init_display()
 
     def init_display(self):
-        for cmd in (
-            SET_DISP | 0x00,  # off
-            # address setting
-            SET_MEM_ADDR,
-            0x00,  # horizontal
-            # resolution and layout
-            SET_DISP_START_LINE | 0x00,
-            SET_SEG_REMAP | 0x01,  # column addr 127 mapped to SEG0
-            SET_MUX_RATIO,
-            self.height - 1,
-            SET_COM_OUT_DIR | 0x08,  # scan from COM[N] to COM0
-            SET_DISP_OFFSET,
-            0x00,
-            SET_COM_PIN_CFG,
-            0x02 if self.width > 2 * self.height else 0x12,
-            # timing and driving scheme
-            SET_DISP_CLK_DIV,
-            0x80,
-            SET_PRECHARGE,
-            0x22 if self.external_vcc else 0xF1,
-            SET_VCOM_DESEL,
-            0x30,  # 0.83*Vcc
-            # display
-            SET_CONTRAST,
-            0xFF,  # maximum
-            SET_ENTIRE_ON,  # output follows RAM contents
-            SET_NORM_INV,  # not inverted
-            # charge pump
-            SET_CHARGE_PUMP,
-            0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01,
-        ):  # on
-            self.write_cmd(cmd)
+        self.write_cmds(
+            bytes(
+                (
+                    SET_DISP | 0x00,  # off
+                    # address setting
+                    SET_MEM_ADDR,
+                    0x00,  # horizontal
+                    # resolution and layout
+                    SET_DISP_START_LINE | 0x00,
+                    SET_SEG_REMAP | 0x01,  # column addr 127 mapped to SEG0
+                    SET_MUX_RATIO,
+                    self.height - 1,
+                    SET_COM_OUT_DIR | 0x08,  # scan from COM[N] to COM0
+                    SET_DISP_OFFSET,
+                    0x00,
+                    SET_COM_PIN_CFG,
+                    0x02 if self.width > 2 * self.height else 0x12,
+                    # timing and driving scheme
+                    SET_DISP_CLK_DIV,
+                    0x80,
+                    SET_PRECHARGE,
+                    0x22 if self.external_vcc else 0xF1,
+                    SET_VCOM_DESEL,
+                    0x30,  # 0.83*Vcc
+                    # display
+                    SET_CONTRAST,
+                    0xFF,  # maximum
+                    SET_ENTIRE_ON,  # output follows RAM contents
+                    SET_NORM_INV,  # not inverted
+                    # charge pump
+                    SET_CHARGE_PUMP,
+                    0x10 if self.external_vcc else 0x14,
+                    SET_DISP | 0x01,  # on
+                )
+            )
+        )
         self.fill(0)
         self.show()
 
+    def write_cmd(self, cmd):
+        self.cmd_buf[0] = cmd
+        self.write_cmds(self.cmd_buf)
+
     def poweroff(self):
         self.write_cmd(SET_DISP | 0x00)
 
@@ -79,25 +116,39 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(SET_DISP | 0x01)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.contrast_cmds[1] = contrast
+        self.write_cmds(self.contrast_cmds)
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
+    def hw_scroll(self, left=False, start_page=0, end_page=None, interval=0):
+        # Continuous horizontal scroll done by the controller, no frame
+        # transfers needed. interval is the 3-bit frame interval code (0-7).
+        # show() stops the scroll first, RAM writes while scrolling is
+        # active are corrupted.
+        if end_page is None:
+            end_page = self.pages - 1
+        if not 0 <= start_page <= end_page < self.pages:
+            raise ValueError("invalid scroll page range")
+        if not 0 <= interval <= 7:
+            raise ValueError("invalid scroll interval")
+        cmds = self.hwscroll_cmds
+        cmds[1] = SET_HWSCROLL_LEFT if left else SET_HWSCROLL_RIGHT
+        cmds[3] = start_page
+        cmds[4] = interval
+        cmds[5] = end_page
+        self.write_cmds(cmds)
+        self._scrolling = True
+
+    def hw_scroll_off(self):
+        self.write_cmd(SET_HWSCROLL_OFF)
+        self._scrolling = False
+
     def show(self):
-        x0 = 0
-        x1 = self.width - 1
-        if self.width == 64:
-            # displays with width of 64 pixels are shifted by 32
-            x0 += 32
-            x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
+        if self._scrolling:
+            self.hw_scroll_off()
+        self.write_cmds(self.show_cmds)
         self.write_data(self.buffer)
 
 
@@ -105,14 +156,14 @@ class SSD1306_I2C(SSD1306):
     def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False):
         self.i2c = i2c
         self.addr = addr
-        self.temp = bytearray(2)
+        self.cmd_list = [b"\x00", None]  # Co=0, D/C#=0
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
         super().__init__(width, height, external_vcc)
 
-    def write_cmd(self, cmd):
-        self.temp[0] = 0x80  # Co=1, D/C#=0
-        self.temp[1] = cmd
-        self.i2c.writeto(self.addr, self.temp)
+    def write_cmds(self, cmds):
+        # whole command sequence in a single I2C transaction
+        self.cmd_list[1] = cmds
+        self.i2c.writevto(self.addr, self.cmd_list)
 
     def write_data(self, buf):
         self.write_list[1] = buf
@@ -126,6 +177,7 @@ class SSD1306_SPI(SSD1306):
         res.init(res.OUT, value=0)
         cs.init(cs.OUT, value=1)
         self.spi = spi
+        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.dc = dc
         self.res = res
         self.cs = cs
@@ -138,16 +190,18 @@ class SSD1306_SPI(SSD1306):
         self.res(1)
         super().__init__(width, height, external_vcc)
 
-    def write_cmd(self, cmd):
+    def reinit_bus(self):
+        # only needed if the SPI bus is shared with other devices
         self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+
+    def write_cmds(self, cmds):
         self.cs(1)
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(cmds)
         self.cs(1)
 
     def write_data(self, buf):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
         self.dc(1)
         self.cs(0)
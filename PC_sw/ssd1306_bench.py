@@ -0,0 +1,173 @@
+import sys
+import os
+import time
+import types
+import importlib.util
+import tracemalloc
+
+# Host-side benchmark for Firmware/ssd1306.py. Counts bus transactions and
+# allocations made by the driver per show() on fake I2C/SPI buses.
+# Usage: python ssd1306_bench.py [path/to/ssd1306.py]
+
+FRAMES = 100
+
+
+def install_micropython_shims():
+    """
+    Provide just enough of micropython/framebuf/time to import the driver on a PC.
+    """
+    micropython = types.ModuleType("micropython")
+    micropython.const = lambda x: x
+    sys.modules["micropython"] = micropython
+
+    framebuf = types.ModuleType("framebuf")
+    framebuf.MONO_VLSB = 0
+
+    class FrameBuffer:
+        def __init__(self, buf, width, height, fmt):
+            self._buf = buf
+
+        def fill(self, c):
+            for i in range(len(self._buf)):
+                self._buf[i] = 0xFF if c else 0x00
+
+    framebuf.FrameBuffer = FrameBuffer
+    sys.modules["framebuf"] = framebuf
+
+    if not hasattr(time, "sleep_ms"):
+        time.sleep_ms = lambda ms: None
+
+
+class AllocationProbe:
+    """
+    Count heap blocks allocated by the driver file.
+    Called from every fake bus transfer, so temporary buffers handed to the
+    bus are seen while they are still alive. Traces are cleared after each
+    count, so a block that stays alive is only counted once.
+    """
+
+    def __init__(self, driver):
+        self.filters = [tracemalloc.Filter(True, driver)]
+        self.active = False
+        self.count = 0
+
+    def start(self):
+        tracemalloc.start()
+        self.active = True
+        self.count = 0
+
+    def stop(self):
+        self()  # blocks allocated after the last transfer
+        self.active = False
+        tracemalloc.stop()
+
+    def __call__(self):
+        if not self.active:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces(self.filters)
+        self.count += len(snapshot.traces)
+        tracemalloc.clear_traces()
+
+
+class FakeI2C:
+    def __init__(self, probe):
+        self.probe = probe
+        self.transactions = 0
+        self.bytes = 0
+
+    def writeto(self, addr, buf):
+        self.probe()
+        self.transactions += 1
+        self.bytes += len(buf)
+
+    def writevto(self, addr, bufs):
+        self.probe()
+        self.transactions += 1
+        for b in bufs:
+            self.bytes += len(b)
+
+
+class FakeSPI:
+    def __init__(self, probe):
+        self.probe = probe
+        self.transactions = 0
+        self.bytes = 0
+        self.inits = 0
+
+    def init(self, **kwargs):
+        self.inits += 1
+
+    def write(self, buf):
+        self.probe()
+        self.transactions += 1
+        self.bytes += len(buf)
+
+
+class FakePin:
+    OUT = 1
+
+    def init(self, mode, value=0):
+        pass
+
+    def __call__(self, value):
+        pass
+
+
+def reset(bus):
+    bus.transactions = 0
+    bus.bytes = 0
+    if hasattr(bus, "inits"):
+        bus.inits = 0
+
+
+def driver_allocations(func, probe, frames):
+    """
+    Return the number of heap blocks the driver allocates per call of func.
+    """
+    func()  # warm up
+    probe.start()
+    for _ in range(frames):
+        func()
+    probe.stop()
+    return probe.count / frames
+
+
+def bench(name, display, bus, probe):
+    reset(bus)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        display.show()
+    elapsed = time.perf_counter() - start
+    print(f"**** {name} ****")
+    print(f"Transactions per show(): {bus.transactions / FRAMES:.1f}")
+    print(f"Bytes per show(): {bus.bytes / FRAMES:.1f}")
+    if hasattr(bus, "inits"):
+        print(f"spi.init() calls per show(): {bus.inits / FRAMES:.1f}")
+    print(f"Driver heap blocks per show(): {driver_allocations(display.show, probe, FRAMES):.1f}")
+    print(f"Host time per show(): {elapsed / FRAMES * 1e6:.1f} us")
+
+
+def main():
+    driver = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "Firmware", "ssd1306.py"
+    )
+    driver = os.path.abspath(driver)
+    install_micropython_shims()
+    spec = importlib.util.spec_from_file_location("ssd1306", driver)
+    ssd1306 = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(ssd1306)
+    probe = AllocationProbe(driver)
+
+    i2c = FakeI2C(probe)
+    oled = ssd1306.SSD1306_I2C(128, 64, i2c)
+    print(f"I2C transactions during init: {i2c.transactions}")
+    bench("SSD1306_I2C", oled, i2c, probe)
+
+    spi = FakeSPI(probe)
+    oled = ssd1306.SSD1306_SPI(128, 64, spi, FakePin(), FakePin(), FakePin())
+    print(f"SPI transactions during init: {spi.transactions}")
+    bench("SSD1306_SPI", oled, spi, probe)
+
+
+if __name__ == "__main__":
+    main()